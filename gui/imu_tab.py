@@ -4,7 +4,7 @@ IMU calibration tab UI components.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter, 
                                QGroupBox, QLabel, QPushButton, QComboBox, 
-                               QTextEdit, QGridLayout, QLCDNumber, QLineEdit)
+                               QPlainTextEdit, QGridLayout, QLCDNumber, QLineEdit)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QColor, QIntValidator
 
@@ -12,6 +12,12 @@ from gui.widgets.angle_indicator import AngleIndicator
 from gui.widgets.attitude_indicator import AttitudeIndicator
 
 
+# Angle indicator colors (immutable, shared by every tab build)
+_ROLL_COLOR = QColor(244, 67, 54)
+_PITCH_COLOR = QColor(76, 175, 80)
+_YAW_COLOR = QColor(33, 150, 243)
+
+
 def setup_imu_tab(main_window):
     """Setup IMU calibration tab"""
     # Create tab widget
@@ -171,70 +177,55 @@ def setup_imu_tab(main_window):
     saved_offsets_group = QGroupBox("Saved IMU Angle Offsets (4-Offset Formula-Based)")
     saved_offsets_layout = QGridLayout(saved_offsets_group)
 
-    # Theme-adaptive styling for different IMUs with distinct colors
-    imu1_style = """
-    QLabel {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 palette(highlight), stop:1 palette(base));
-        color: palette(highlighted-text);
+    # Theme-adaptive styling for different IMUs with distinct colors, parsed once for
+    # the whole group; value labels pick their colors through the "imu" property
+    saved_offsets_group.setStyleSheet("""
+    QLabel[imu] {
         padding: 8px;
-        border: 2px solid palette(highlight);
+        border: 2px solid palette(mid);
         border-radius: 4px;
         font-family: 'Consolas', 'Monaco', monospace;
         font-size: 11pt;
         font-weight: bold;
         min-width: 80px;
     }
-    """
-
-    imu2_style = """
-    QLabel {
+    QLabel[imu="1"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 palette(highlight), stop:1 palette(base));
+        color: palette(highlighted-text);
+        border-color: palette(highlight);
+    }
+    QLabel[imu="2"] {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 palette(button), stop:1 palette(base));
         color: palette(button-text);
-        padding: 8px;
-        border: 2px solid palette(button);
-        border-radius: 4px;
-        font-family: 'Consolas', 'Monaco', monospace;
-        font-size: 11pt;
-        font-weight: bold;
-        min-width: 80px;
+        border-color: palette(button);
     }
-    """
-
-    imu3_style = """
-    QLabel {
+    QLabel[imu="3"] {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 palette(mid), stop:1 palette(base));
         color: palette(text);
-        padding: 8px;
-        border: 2px solid palette(mid);
-        border-radius: 4px;
-        font-family: 'Consolas', 'Monaco', monospace;
-        font-size: 11pt;
-        font-weight: bold;
-        min-width: 80px;
     }
-    """
+    """)
 
     # 4-Offset Formula-Based Display
     # Row 0: IMU 1 Pitch + IMU 1 Roll
     saved_offsets_layout.addWidget(QLabel("IMU 1 Pitch:"), 0, 0)
     main_window.angle_offset1_label = QLabel("0.000000")
-    main_window.angle_offset1_label.setStyleSheet(imu1_style)
+    main_window.angle_offset1_label.setProperty("imu", "1")
     saved_offsets_layout.addWidget(main_window.angle_offset1_label, 0, 1)
 
     saved_offsets_layout.addWidget(QLabel("IMU 1 Roll:"), 0, 2)
     main_window.angle_offset2_label = QLabel("0.000000")
-    main_window.angle_offset2_label.setStyleSheet(imu1_style)
+    main_window.angle_offset2_label.setProperty("imu", "1")
     saved_offsets_layout.addWidget(main_window.angle_offset2_label, 0, 3)
 
     # Row 1: IMU 2 Roll + IMU 3 Roll (no pitch, only roll offsets)
     saved_offsets_layout.addWidget(QLabel("IMU 2 Roll:"), 1, 0)
     main_window.angle_offset3_label = QLabel("0.000000")
-    main_window.angle_offset3_label.setStyleSheet(imu2_style)
+    main_window.angle_offset3_label.setProperty("imu", "2")
     saved_offsets_layout.addWidget(main_window.angle_offset3_label, 1, 1)
 
     saved_offsets_layout.addWidget(QLabel("IMU 3 Roll:"), 1, 2)
     main_window.angle_offset4_label = QLabel("0.000000")
-    main_window.angle_offset4_label.setStyleSheet(imu3_style)
+    main_window.angle_offset4_label.setProperty("imu", "3")
     saved_offsets_layout.addWidget(main_window.angle_offset4_label, 1, 3)
 
     # Legacy offset labels (kept for backward compatibility in code but not displayed)
@@ -263,9 +254,9 @@ def setup_imu_tab(main_window):
     
     # Individual angle indicators
     angles_layout = QHBoxLayout()
-    main_window.roll_indicator = AngleIndicator("Roll", -180, 180, QColor(244, 67, 54))
-    main_window.pitch_indicator = AngleIndicator("Pitch", -90, 90, QColor(76, 175, 80))
-    main_window.yaw_indicator = AngleIndicator("Yaw", -180, 180, QColor(33, 150, 243))
+    main_window.roll_indicator = AngleIndicator("Roll", -180, 180, _ROLL_COLOR)
+    main_window.pitch_indicator = AngleIndicator("Pitch", -90, 90, _PITCH_COLOR)
+    main_window.yaw_indicator = AngleIndicator("Yaw", -180, 180, _YAW_COLOR)
     
     angles_layout.addWidget(main_window.roll_indicator)
     angles_layout.addWidget(main_window.pitch_indicator)
@@ -279,23 +270,29 @@ def setup_imu_tab(main_window):
     data_group = QGroupBox("Raw Accelerometer Data")
     data_layout = QGridLayout(data_group)
     
-    # Raw acceleration values with LCD displays - theme adaptive
+    # Raw acceleration values with LCD displays - theme adaptive, one stylesheet for all three
+    data_group.setStyleSheet(
+        "QLCDNumber { border: 1px solid palette(mid); }"
+        "QLCDNumber#ax_lcd { background: palette(highlight); color: palette(highlighted-text); }"
+        "QLCDNumber#ay_lcd { background: palette(button); color: palette(button-text); }"
+        "QLCDNumber#az_lcd { background: palette(dark); color: palette(bright-text); }"
+    )
     data_layout.addWidget(QLabel("AX:"), 0, 0)
     main_window.ax_lcd = QLCDNumber(6)
     main_window.ax_lcd.setDigitCount(6)
-    main_window.ax_lcd.setStyleSheet("QLCDNumber { background: palette(highlight); color: palette(highlighted-text); border: 1px solid palette(mid); }")
+    main_window.ax_lcd.setObjectName("ax_lcd")
     data_layout.addWidget(main_window.ax_lcd, 0, 1)
     
     data_layout.addWidget(QLabel("AY:"), 1, 0)
     main_window.ay_lcd = QLCDNumber(6)
     main_window.ay_lcd.setDigitCount(6)
-    main_window.ay_lcd.setStyleSheet("QLCDNumber { background: palette(button); color: palette(button-text); border: 1px solid palette(mid); }")
+    main_window.ay_lcd.setObjectName("ay_lcd")
     data_layout.addWidget(main_window.ay_lcd, 1, 1)
     
     data_layout.addWidget(QLabel("AZ:"), 2, 0)
     main_window.az_lcd = QLCDNumber(6)
     main_window.az_lcd.setDigitCount(6)
-    main_window.az_lcd.setStyleSheet("QLCDNumber { background: palette(dark); color: palette(bright-text); border: 1px solid palette(mid); }")
+    main_window.az_lcd.setObjectName("az_lcd")
     data_layout.addWidget(main_window.az_lcd, 2, 1)
     
     right_layout.addWidget(data_group)
@@ -305,10 +302,12 @@ def setup_imu_tab(main_window):
     imu_monitor_layout = QVBoxLayout(imu_monitor_group)
     
     # IMU Serial output display
-    main_window.imu_serial_output = QTextEdit()
+    main_window.imu_serial_output = QPlainTextEdit()
     main_window.imu_serial_output.setReadOnly(True)
     main_window.imu_serial_output.setFont(QFont("Courier", 9))
     main_window.imu_serial_output.setMaximumHeight(200)
+    main_window.imu_serial_output.setUndoRedoEnabled(False)
+    main_window.imu_serial_output.setMaximumBlockCount(2000)
     imu_monitor_layout.addWidget(main_window.imu_serial_output)
     
     # Clear IMU button
@@ -4,7 +4,7 @@ Load Cell calibration tab UI components.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter, 
                                QGroupBox, QLabel, QPushButton, QComboBox, 
-                               QSpinBox, QDoubleSpinBox, QTextEdit, QProgressBar, QLineEdit)
+                               QSpinBox, QDoubleSpinBox, QPlainTextEdit, QProgressBar, QLineEdit)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QIntValidator
 
@@ -222,9 +222,13 @@ def setup_load_cell_tab(main_window):
     monitor_layout = QVBoxLayout(monitor_group)
     
     # Serial output display
-    main_window.serial_output = QTextEdit()
+    # Plain text widget - no rich-text layout, and it only follows new lines when scrolled to the bottom
+    main_window.serial_output = QPlainTextEdit()
     main_window.serial_output.setReadOnly(True)
     main_window.serial_output.setFont(QFont("Courier", 10))
+    main_window.serial_output.setUndoRedoEnabled(False)
+    # Keep only the most recent lines so the document doesn't grow for the whole session
+    main_window.serial_output.setMaximumBlockCount(2000)
     monitor_layout.addWidget(main_window.serial_output)
     
     # Clear button
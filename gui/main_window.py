@@ -8,21 +8,21 @@ import threading
 import time
 import subprocess
 import re
-import serial
-import serial.tools.list_ports
+from collections import deque
 from datetime import datetime
 import toml
 import glob
 
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QMessageBox, QLabel, QDialog, QTableWidgetItem
-from PySide6.QtCore import QTimer, Signal, QThread, QObject, Qt
-from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtCore import QTimer, Signal, QThread, QObject, Qt, QSignalBlocker
+from PySide6.QtGui import QFont
 
 from utils.logger import Logger
 from utils.user_data import UserDataManager
-from utils.arduino_manager import ArduinoManager
+from utils.arduino_manager import ArduinoManager, run_cli, stream_cli
 from gui.workers.serial_worker import SerialWorker
 from gui.workers.imu_worker import IMUDataWorker
+from gui.workers.port_scan_worker import PortScanWorker
 from gui.load_cell_tab import setup_load_cell_tab
 from gui.imu_tab import setup_imu_tab
 from gui.upload_firmware_tab import setup_upload_firmware_tab
@@ -30,12 +30,43 @@ from gui.setup_dialog import SetupDialog
 from gui.widgets.update_dialog import UpdateNotificationDialog, UpdateChecker
 from version import get_version_string
 
+if sys.platform == 'win32':
+    import ctypes.wintypes
+
+# Windows message sent when a device (e.g. a USB serial adapter) is added or removed
+WM_DEVICECHANGE = 0x0219
+
+# Teensy serial port detection (PJRC vendor ID and common Teensy product IDs)
+_TEENSY_VID = 0x16C0
+_TEENSY_PIDS = frozenset({0x0483, 0x0486, 0x04D0, 0x04D1})
+_TEENSY_RE = re.compile(r'teensy|pjrc', re.IGNORECASE)
+_PJRC_RE = re.compile(r'pjrc', re.IGNORECASE)
+
+# Firmware source patterns used when writing the calibration factor into the sketch
+_CAL_FACTOR_RE = re.compile(r'float\s+calibration_factor\s*=\s*[\d\.\-]+\s*;')
+_MARS_ID_COMMENT_RE = re.compile(r'// Mars ID:.*')
+
+# Seconds to wait after closing a serial port before uploading to it
+_PORT_SETTLE_SECS = 1.0
+
+# How long to wait for a serial worker thread to finish after stop_connection()
+_THREAD_STOP_TIMEOUT_MS = 2000
+
+# Lines a hidden serial/IMU monitor keeps queued: the monitors' maximumBlockCount (2000)
+# less one, leaving room for the "lines omitted" marker
+_MONITOR_BUFFER_LINES = 1999
+
+# Connect buttons turn red while connected (they then act as "Disconnect")
+_DISCONNECT_BUTTON_SS = "QPushButton { background: #f44336; color: white; }"
+
+
 
 class LoadCellCalibrationGUI(QMainWindow):
     # Add signals for thread-safe logging and step updates
     log_signal = Signal(str)
     upload_log_signal = Signal(str)  # For Upload Firmware tab
     step_update_signal = Signal(int, str)  # step number, message
+    upload_finished_signal = Signal(str)  # upload type
     
     def __init__(self):
         super().__init__()
@@ -51,14 +82,29 @@ class LoadCellCalibrationGUI(QMainWindow):
         # Serial connection variables
         self.serial_worker = None
         self.serial_thread = None
+        # Worker threads that did not stop within _THREAD_STOP_TIMEOUT_MS, kept referenced
+        # (with their workers) until they finish so Qt never destroys a running QThread
+        self._stopping_threads = []
         self.is_connected = False
         self.current_calibration_factor = 1.0
         
+        # Pre-encoded load cell commands and their monitor labels
+        self._cmd_bytes = {'tare': b't', 'calib': b'r'}
+        self._cmd_labels = {'tare': 'tare', 'calib': 'start calibration'}
+        
         # IMU connection variables
         self.imu_worker = None
         self.imu_thread = None
         self.is_imu_connected = False
-        self.current_imu_data = {}
+        self.current_imu_data = None
+        # Last values shown on the AX/AY/AZ LCDs (rounded to the displayed precision)
+        self._last_ax = self._last_ay = self._last_az = None
+        # Newest IMU sample waiting to be shown; the IMU widgets update at most ~30 Hz
+        self._pending_imu = None
+        self._imu_ui_timer = QTimer(self)
+        self._imu_ui_timer.setSingleShot(True)
+        self._imu_ui_timer.setInterval(33)
+        self._imu_ui_timer.timeout.connect(self._flush_imu_ui)
         
         # Current IMU offsets
         self.current_offset_x = 0.0
@@ -112,6 +158,10 @@ class LoadCellCalibrationGUI(QMainWindow):
 
         # Show setup dialog on first run
         self.show_setup_dialog_if_needed()
+        
+        # Installed Arduino cores (None until the background query finishes)
+        self._installed_cores = None
+        threading.Thread(target=self._load_installed_cores, daemon=True).start()
 
         self.logger.log(f"Unified calibration file: {self.unified_calibration_file}")
         self.logger.log(f"Production firmware file: {self.firmware_file}")
@@ -122,10 +172,37 @@ class LoadCellCalibrationGUI(QMainWindow):
         self.log_signal.connect(self.log_message_to_ui)
         self.upload_log_signal.connect(self.log_upload_message_to_ui)
         self.step_update_signal.connect(self.handle_step_update)
+        self.upload_finished_signal.connect(self.handle_upload_finished)
+        
+        # Serial port scan cache: (scan time, ports). Reused for 1 s, or on Windows
+        # (where enumeration is slow) until a device change is reported
+        self._ports_cache = None
+        self._ports_dirty = True
+        # (device, description) of the ports currently in the selectors
+        self._shown_ports = None
+        self._scan_in_progress = False
+        self.port_scan_worker = None
+        self.port_scan_thread = None
+        self._port_rescan_timer = QTimer(self)
+        self._port_rescan_timer.setSingleShot(True)
+        self._port_rescan_timer.setInterval(500)
+        self._port_rescan_timer.timeout.connect(self._refresh_ports_if_stale)
+        
+        # Serial/IMU monitor and upload status lines waiting to be appended in one batch (~10 Hz).
+        # Upload output (compile errors come first) is kept in full until shown.
+        self._ui_log_buf = deque(maxlen=_MONITOR_BUFFER_LINES)
+        self._imu_ui_log_buf = deque(maxlen=_MONITOR_BUFFER_LINES)
+        self._upload_ui_log_buf = deque()
+        # Lines pushed out of a full monitor buffer while its tab was hidden
+        self._ui_log_omitted = {'serial': 0, 'imu': 0, 'upload': 0}
+        self._ui_log_timer = QTimer(self)
+        self._ui_log_timer.setSingleShot(True)
+        self._ui_log_timer.setInterval(100)
+        self._ui_log_timer.timeout.connect(self._flush_ui_log)
         
         # Setup UI
         self.setup_ui()
-        self.refresh_ports()
+        self._refresh_ports_if_stale()
         self.update_step_status()
         
         # Load saved Mars ID
@@ -137,10 +214,6 @@ class LoadCellCalibrationGUI(QMainWindow):
         
         # Check for updates on startup (after a short delay)
         QTimer.singleShot(3000, self.check_for_updates)
-        
-        # Timer for periodic updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
     
     def show_setup_dialog_if_needed(self):
         """Show setup dialog if Arduino CLI is not available"""
@@ -161,10 +234,19 @@ class LoadCellCalibrationGUI(QMainWindow):
         else:
             self.logger.log("Arduino CLI found, skipping setup dialog")
         
+    def _load_installed_cores(self):
+        """Query installed Arduino cores once so uploads can skip 'core install'"""
+        try:
+            self._installed_cores = self.arduino_manager.get_installed_cores()
+            self.logger.log(f"Installed Arduino cores: {', '.join(sorted(self._installed_cores)) or 'none'}")
+        except Exception as e:
+            self.logger.log_warning(f"Could not query installed Arduino cores: {str(e)}")
+            
     def handle_step_update(self, step, message):
         """Handle step updates from background threads"""
-        self.current_step = step
-        self.update_step_status()
+        if step != self.current_step:
+            self.current_step = step
+            self.update_step_status()
         if message:
             ui_message = self.logger.log_step(message)
             self.log_message_to_ui(ui_message)
@@ -193,29 +275,21 @@ class LoadCellCalibrationGUI(QMainWindow):
         setup_imu_tab(self)
         setup_upload_firmware_tab(self)
         
+        # Monitors on hidden tabs keep their lines queued; show them when the tab is opened
+        self.tab_widget.currentChanged.connect(self._flush_ui_log)
+        
     def update_step_status(self):
         """Update the visual status of steps"""
-        # Reset all steps
-        self.step1.set_current(False)
-        self.step1.set_completed(False)
-        self.step2.set_current(False)
-        self.step2.set_completed(False)
+        step = self.current_step
+        
+        # Set each step's final state once (step >= 3 means all completed)
+        self.step1.set_state(completed=step >= 2, current=step == 1)
+        self.step2.set_state(completed=step >= 3, current=step == 2)
         
         # Enable/disable groups
         self.step1_group.setEnabled(True)
-        self.step2_group.setEnabled(False)
+        self.step2_group.setEnabled(step == 2)
         self.calibration_status_group.setEnabled(True)
-        
-        if self.current_step == 1:
-            self.step1.set_current(True)
-            self.step1_group.setEnabled(True)
-        elif self.current_step == 2:
-            self.step1.set_completed(True)
-            self.step2.set_current(True)
-            self.step2_group.setEnabled(True)
-        elif self.current_step >= 3:  # All completed
-            self.step1.set_completed(True)
-            self.step2.set_completed(True)
     
     # Mars ID Management Methods
     def set_mars_id(self, mars_id):
@@ -317,12 +391,13 @@ class LoadCellCalibrationGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a port first!")
             return
             
+        port_settle = 0
         # Disconnect serial if connected
         if self.is_connected:
             ui_message = self.logger.log("Disconnecting serial for upload")
             self.log_message_to_ui(ui_message)
-            self.disconnect_serial()
-            time.sleep(1)
+            self.disconnect_serial(silent=True)
+            port_settle = _PORT_SETTLE_SECS
             
         # Show progress bar
         self.progress_bar.setVisible(True)
@@ -338,7 +413,7 @@ class LoadCellCalibrationGUI(QMainWindow):
         self.log_message_to_ui(ui_message)
         
         # Run upload in separate thread
-        threading.Thread(target=self._upload_thread, args=(self.unified_calibration_file, selected_board, selected_port, "unified_calibration"), daemon=True).start()
+        threading.Thread(target=self._upload_thread, args=(self.unified_calibration_file, selected_board, selected_port, "unified_calibration", port_settle), daemon=True).start()
         
     def upload_firmware_code(self):
         """Upload firmware Arduino code"""
@@ -356,12 +431,13 @@ class LoadCellCalibrationGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a port first!")
             return
             
+        port_settle = 0
         # Disconnect serial if connected
         if self.is_connected:
             ui_message = self.logger.log("Disconnecting serial for firmware upload")
             self.log_message_to_ui(ui_message)
-            self.disconnect_serial()
-            time.sleep(1)
+            self.disconnect_serial(silent=True)
+            port_settle = _PORT_SETTLE_SECS
             
         # Show progress bar
         self.progress_bar.setVisible(True)
@@ -377,7 +453,7 @@ class LoadCellCalibrationGUI(QMainWindow):
         self.log_message_to_ui(ui_message)
         
         # Run upload in separate thread
-        threading.Thread(target=self._upload_thread, args=(self.firmware_file, selected_board, selected_port, "firmware"), daemon=True).start()
+        threading.Thread(target=self._upload_thread, args=(self.firmware_file, selected_board, selected_port, "firmware", port_settle), daemon=True).start()
         
     def update_firmware_code(self):
         """Update firmware.ino file with current calibration factor"""
@@ -403,16 +479,12 @@ class LoadCellCalibrationGUI(QMainWindow):
                 content = file.read()
             
             # Update the calibration factor line
-            pattern = r'float calibration_factor\s*=\s*[\d\.-]+;'
             replacement = f'float calibration_factor = {self.current_calibration_factor:.2f}; // Mars ID: {self.current_mars_id}'
-            
-            updated_content = re.sub(pattern, replacement, content)
+            updated_content, replaced = _CAL_FACTOR_RE.subn(replacement, content)
             
             # Also try to update Mars ID comment if it exists, otherwise add it
-            mars_id_pattern = r'// Mars ID:.*'
-            if re.search(mars_id_pattern, updated_content):
-                updated_content = re.sub(mars_id_pattern, f'// Mars ID: {self.current_mars_id}', updated_content)
-            else:
+            updated_content, mars_id_updated = _MARS_ID_COMMENT_RE.subn(f'// Mars ID: {self.current_mars_id}', updated_content)
+            if not mars_id_updated:
                 # Add Mars ID comment at the top after any existing header comments
                 lines = updated_content.split('\n')
                 insert_index = 0
@@ -424,18 +496,31 @@ class LoadCellCalibrationGUI(QMainWindow):
                 updated_content = '\n'.join(lines)
             
             # Check if replacement was made
-            if 'calibration_factor' in content:
+            if replaced > 0 and updated_content == content:
+                # Same factor and Mars ID already in the sketch - no backup or rewrite needed
+                ui_message = self.logger.log_calibration(
+                    f"Firmware already has calibration factor {self.current_calibration_factor:.2f}, no changes written")
+                self.log_message_to_ui(ui_message)
+                self.upload_firmware_button.setEnabled(True)
+            elif replaced > 0:
+                # Write updated content to a temp file first so a failed write never touches the sketch
+                tmp_path = self.firmware_file + ".tmp"
+                try:
+                    with open(tmp_path, 'w') as file:
+                        file.write(updated_content)
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                
                 # Create backup with Mars ID
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 mars_prefix = self.get_mars_filename_prefix()
                 backup_filename = f"{mars_prefix}firmware_backup_{timestamp}.ino"
                 backup_path = os.path.join(os.path.dirname(self.firmware_file), backup_filename)
-                with open(backup_path, 'w') as backup_file:
-                    backup_file.write(content)
-                
-                # Write updated content
-                with open(self.firmware_file, 'w') as file:
-                    file.write(updated_content)
+                # The original file becomes the backup and the temp file takes its place (renames only)
+                os.replace(self.firmware_file, backup_path)
+                os.replace(tmp_path, self.firmware_file)
                 
                 success_msg = f"Updated firmware with calibration factor: {self.current_calibration_factor:.2f}"
                 backup_msg = f"Backup saved as: {backup_path}"
@@ -465,55 +550,75 @@ class LoadCellCalibrationGUI(QMainWindow):
             ui_message = self.logger.log_error(error_msg)
             self.log_message_to_ui(ui_message)
             
-    def _upload_thread(self, sketch_path, board, port, upload_type):
+    def _upload_thread(self, sketch_path, board, port, upload_type, port_settle=0):
         """Upload thread function"""
+        # Give the OS time to release a port we just disconnected from, off the GUI thread
+        if port_settle:
+            time.sleep(port_settle)
+        
         # Determine which signal to use based on upload_type
         log_emit = self.upload_log_signal.emit if upload_type == "final_firmware" else self.log_signal.emit
 
         try:
 
-            log_emit(self.logger.log_upload(f"{upload_type.title()} Upload parameters:"))
-            log_emit(self.logger.log_upload(f"  File: {sketch_path}"))
-            log_emit(self.logger.log_upload(f"  Board: {board}"))
-            log_emit(self.logger.log_upload(f"  Port: {port}"))
+            # Multi-line messages are emitted once so the GUI thread lays them out in one pass
+            log_emit("\n".join([
+                self.logger.log_upload(f"{upload_type.title()} Upload parameters:"),
+                self.logger.log_upload(f"  File: {sketch_path}"),
+                self.logger.log_upload(f"  Board: {board}"),
+                self.logger.log_upload(f"  Port: {port}"),
+            ]))
 
             # Use arduino-cli from ArduinoManager (Documents/HOMER/arduino-cli)
             arduino_cli_path = self.arduino_manager.get_arduino_cli_command()
 
             # Check if arduino-cli exists
             if not os.path.exists(arduino_cli_path):
-                log_emit(self.logger.log_error("Arduino CLI not found!"))
-                log_emit(self.logger.log_error(f"Expected location: {arduino_cli_path}"))
-                log_emit(self.logger.log_error("Please run the setup process from File menu or restart the application."))
+                log_emit("\n".join([
+                    self.logger.log_error("Arduino CLI not found!"),
+                    self.logger.log_error(f"Expected location: {arduino_cli_path}"),
+                    self.logger.log_error("Please run the setup process from File menu or restart the application."),
+                ]))
                 return
             
-            # Install required cores if needed
-            if "mbed_nano" in board:
-                log_emit(self.logger.log_upload("Checking Arduino Nano core installation..."))
-                log_emit(self.logger.log_upload("This may take several minutes on first run - please wait..."))
-                core_install_cmd = f'"{arduino_cli_path}" core install arduino:mbed_nano'
+            # Install required cores if needed (skipped when already installed)
+            core_id = ":".join(board.split(":")[:2])
+            if self._installed_cores is not None and core_id in self._installed_cores:
+                log_emit(self.logger.log_upload(f"Core {core_id} already installed"))
+            elif "mbed_nano" in board:
+                log_emit("\n".join([
+                    self.logger.log_upload("Checking Arduino Nano core installation..."),
+                    self.logger.log_upload("This may take several minutes on first run - please wait..."),
+                ]))
+                core_install_cmd = [arduino_cli_path, "core", "install", "arduino:mbed_nano"]
                 try:
-                    result = subprocess.run(core_install_cmd, shell=True, capture_output=True, text=True, timeout=300)  # 5 minute timeout
+                    result = run_cli(core_install_cmd, timeout=300)  # 5 minute timeout
                     if result.returncode == 0:
                         log_emit(self.logger.log_upload("Arduino Nano core installation check complete"))
+                        if self._installed_cores is not None:
+                            self._installed_cores.add("arduino:mbed_nano")
                     else:
                         log_emit(self.logger.log_warning(f"Arduino Nano core install result: {result.stderr}"))
                 except subprocess.TimeoutExpired:
                     log_emit(self.logger.log_error("Core installation timed out after 5 minutes. Please check your internet connection and try again."))
             elif "teensy" in board:
-                log_emit(self.logger.log_upload("Checking Teensy core installation..."))
-                log_emit(self.logger.log_upload("This may take several minutes on first run - please wait..."))
-                core_install_cmd = f'"{arduino_cli_path}" core install teensy:avr'
+                log_emit("\n".join([
+                    self.logger.log_upload("Checking Teensy core installation..."),
+                    self.logger.log_upload("This may take several minutes on first run - please wait..."),
+                ]))
+                core_install_cmd = [arduino_cli_path, "core", "install", "teensy:avr"]
                 try:
-                    result = subprocess.run(core_install_cmd, shell=True, capture_output=True, text=True, timeout=300)  # 5 minute timeout
+                    result = run_cli(core_install_cmd, timeout=300)  # 5 minute timeout
                     if result.returncode == 0:
                         log_emit(self.logger.log_upload("Teensy core installation check complete"))
+                        if self._installed_cores is not None:
+                            self._installed_cores.add("teensy:avr")
                     else:
                         log_emit(self.logger.log_warning(f"Teensy core install result: {result.stderr}"))
                         # Try alternative Teensy installation
                         log_emit(self.logger.log_upload("Trying alternative Teensy core installation..."))
-                        alt_core_cmd = f'"{arduino_cli_path}" core install arduino:teensy'
-                        alt_result = subprocess.run(alt_core_cmd, shell=True, capture_output=True, text=True, timeout=300)
+                        alt_core_cmd = [arduino_cli_path, "core", "install", "arduino:teensy"]
+                        alt_result = run_cli(alt_core_cmd, timeout=300)
                         if alt_result.returncode == 0:
                             log_emit(self.logger.log_success("Alternative Teensy core installation successful"))
                         else:
@@ -522,23 +627,29 @@ class LoadCellCalibrationGUI(QMainWindow):
                     log_emit(self.logger.log_error("Core installation timed out after 5 minutes. Please check your internet connection and try again."))
             
             # Compile command
-            compile_cmd = f'"{arduino_cli_path}" compile --fqbn {board} "{sketch_path}"'
+            compile_cmd = [arduino_cli_path, "compile", "--fqbn", board, sketch_path]
             
             # Upload command
-            upload_cmd = f'"{arduino_cli_path}" upload -p {port} --fqbn {board} "{sketch_path}"'
+            upload_cmd = [arduino_cli_path, "upload", "-p", port, "--fqbn", board, sketch_path]
+            
+            # arduino-cli output is shown line by line as it runs
+            def log_cli_line(line):
+                log_emit(self.logger.log_upload(f"  {line}"))
             
             # Execute commands
             log_emit(self.logger.log_upload(f"Compiling {upload_type} sketch..."))
             try:
-                result = subprocess.run(compile_cmd, shell=True, capture_output=True, text=True, timeout=120)  # 2 minute timeout
+                returncode = stream_cli(compile_cmd, 120, log_cli_line)  # 2 minute timeout
 
-                if result.returncode == 0:
-                    log_emit(self.logger.log_success(f"{upload_type.title()} compilation successful!"))
-                    log_emit(self.logger.log_upload(f"Uploading {upload_type} to {port}..."))
+                if returncode == 0:
+                    log_emit("\n".join([
+                        self.logger.log_success(f"{upload_type.title()} compilation successful!"),
+                        self.logger.log_upload(f"Uploading {upload_type} to {port}..."),
+                    ]))
 
-                    result = subprocess.run(upload_cmd, shell=True, capture_output=True, text=True, timeout=60)  # 1 minute timeout
+                    returncode = stream_cli(upload_cmd, 60, log_cli_line)  # 1 minute timeout
 
-                    if result.returncode == 0:
+                    if returncode == 0:
                         log_emit(self.logger.log_success(f"{upload_type.title()} upload successful!"))
 
                         # Update step progress using signal (only for Load Cell tab, not IMU tab)
@@ -549,14 +660,16 @@ class LoadCellCalibrationGUI(QMainWindow):
                         # Note: unified_calibration_imu upload doesn't trigger step updates (IMU tab has no steps)
 
                     else:
-                        log_emit(self.logger.log_error(f"{upload_type.title()} upload failed: {result.stderr}"))
+                        log_emit(self.logger.log_error(f"{upload_type.title()} upload failed (exit code {returncode})"))
                         if "mbed_nano" in board:
                             log_emit(self.logger.log_warning("Note: Make sure to double-press the reset button on Nano 33 BLE to enter bootloader mode"))
                         elif "teensy" in board:
-                            log_emit(self.logger.log_warning("Note: Make sure Teensy is in programming mode. Press the program button on Teensy if needed"))
-                            log_emit(self.logger.log_warning("Tip: Try using Teensy Loader application if upload continues to fail"))
+                            log_emit("\n".join([
+                                self.logger.log_warning("Note: Make sure Teensy is in programming mode. Press the program button on Teensy if needed"),
+                                self.logger.log_warning("Tip: Try using Teensy Loader application if upload continues to fail"),
+                            ]))
                 else:
-                    log_emit(self.logger.log_error(f"{upload_type.title()} compilation failed: {result.stderr}"))
+                    log_emit(self.logger.log_error(f"{upload_type.title()} compilation failed (exit code {returncode})"))
 
             except subprocess.TimeoutExpired:
                 log_emit(self.logger.log_error(f"{upload_type.title()} operation timed out. Please check connections and try again."))
@@ -564,14 +677,18 @@ class LoadCellCalibrationGUI(QMainWindow):
         except Exception as e:
             log_emit(self.logger.log_error(f"{upload_type.title()} upload error: {str(e)}"))
         finally:
-            # Hide progress bar and re-enable button
-            self.progress_bar.setVisible(False)
-            if upload_type in ["calibration", "unified_calibration"]:
-                self.upload_cal_button.setEnabled(True)
-            elif upload_type in ["IMU", "unified_calibration_imu"]:
-                self.upload_imu_button.setEnabled(True)
-            else:
-                self.upload_firmware_button.setEnabled(True)
+            # Widgets may only be touched on the GUI thread
+            self.upload_finished_signal.emit(upload_type)
+
+    def handle_upload_finished(self, upload_type):
+        """Hide progress bar and re-enable the upload button after an upload thread ends"""
+        self.progress_bar.setVisible(False)
+        if upload_type in ["calibration", "unified_calibration"]:
+            self.upload_cal_button.setEnabled(True)
+        elif upload_type in ["IMU", "unified_calibration_imu"]:
+            self.upload_imu_button.setEnabled(True)
+        else:
+            self.upload_firmware_button.setEnabled(True)
 
     def show_arduino_cli_download_dialog(self):
         """Show setup dialog to download Arduino CLI"""
@@ -604,15 +721,86 @@ class LoadCellCalibrationGUI(QMainWindow):
         else:
             self.logger.log("User declined Arduino CLI download")
 
+    def _get_cached_ports(self):
+        """Return the last port scan if it can be reused, otherwise None"""
+        if self._ports_cache is None or self._ports_dirty:
+            return None
+        scanned_at, ports = self._ports_cache
+        if sys.platform == 'win32' or time.monotonic() - scanned_at < 1.0:
+            return ports
+        return None
+        
+    def _start_port_scan(self):
+        """Enumerate serial ports on a worker thread; results arrive in _on_ports_scanned"""
+        self._scan_in_progress = True
+        self.port_scan_thread = QThread()
+        self.port_scan_worker = PortScanWorker()
+        self.port_scan_worker.moveToThread(self.port_scan_thread)
+        
+        self.port_scan_thread.started.connect(self.port_scan_worker.run)
+        self.port_scan_worker.ports_ready.connect(self._on_ports_scanned)
+        self.port_scan_worker.ports_ready.connect(self.port_scan_thread.quit)
+        self.port_scan_thread.finished.connect(self._on_port_scan_finished)
+        self.port_scan_thread.finished.connect(self.port_scan_worker.deleteLater)
+        self.port_scan_thread.finished.connect(self.port_scan_thread.deleteLater)
+        
+        self.port_scan_thread.start()
+        
+    def _on_ports_scanned(self, ports):
+        """Cache a finished background scan and show it"""
+        self._ports_cache = (time.monotonic(), ports)
+        self._ports_dirty = False
+        self.populate_ports(ports)
+        
+    def _on_port_scan_finished(self):
+        """Allow a new scan once the previous scan thread has fully stopped"""
+        self._scan_in_progress = False
+        
+    def nativeEvent(self, eventType, message):
+        """Rescan serial ports when Windows reports a device being plugged or unplugged"""
+        if sys.platform == 'win32' and bytes(eventType) == b"windows_generic_MSG":
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == WM_DEVICECHANGE:
+                self._ports_dirty = True
+                # Debounce the burst of messages a single plug event produces
+                self._port_rescan_timer.start()
+        return super().nativeEvent(eventType, message)
+        
     def refresh_ports(self):
-        """Refresh available serial ports"""
+        """Rescan serial ports on a Refresh click; the cached list is never reused here"""
+        # Virtual and Bluetooth COM ports may appear without a WM_DEVICECHANGE
+        self._ports_dirty = True
+        self._refresh_ports_if_stale()
+        
+    def _refresh_ports_if_stale(self):
+        """Refresh available serial ports, scanning in the background unless a recent scan can be reused"""
         self.logger.log("Refreshing serial ports")
-        self.port_combo.clear()
-        if hasattr(self, 'imu_port_combo'):
-            self.imu_port_combo.clear()
-        if hasattr(self, 'final_port_combo'):
-            self.final_port_combo.clear()
-        ports = serial.tools.list_ports.comports()
+        ports = self._get_cached_ports()
+        if ports is not None:
+            self.populate_ports(ports)
+        elif not self._scan_in_progress:
+            self._start_port_scan()
+            
+    def populate_ports(self, ports):
+        """Fill the port selectors from a list of scanned ports"""
+        # Leave the selectors (and the user's choice) alone if nothing was plugged or unplugged
+        shown = tuple((port.device, port.description or '') for port in ports)
+        if shown == self._shown_ports:
+            self.log_message_to_ui(self.logger.log("Serial ports unchanged"))
+            return
+        self._shown_ports = shown
+        
+        # Refill every selector in one call each, without per-item signal traffic
+        devices = [port.device for port in ports]
+        for name in ('port_combo', 'imu_port_combo', 'final_port_combo'):
+            combo = getattr(self, name, None)
+            if combo is not None:
+                with QSignalBlocker(combo):
+                    previous = combo.currentText()
+                    combo.clear()
+                    combo.addItems(devices)
+                    if previous in devices:
+                        combo.setCurrentText(previous)
         
         # Add debug information
         ports_msg = f"Found {len(ports)} serial ports"
@@ -631,24 +819,18 @@ class LoadCellCalibrationGUI(QMainWindow):
             
             # Check if this is a Teensy device
             is_teensy = False
-            if port.description and any(keyword in port.description.lower() for keyword in ['teensy', 'pjrc']):
+            if port.description and _TEENSY_RE.search(port.description):
                 is_teensy = True
                 teensy_ports.append(port)
-            elif port.manufacturer and 'pjrc' in port.manufacturer.lower():
+            elif port.manufacturer and _PJRC_RE.search(port.manufacturer):
                 is_teensy = True
                 teensy_ports.append(port)
-            elif port.vid == 0x16C0 and port.pid in [0x0483, 0x0486, 0x04D0, 0x04D1]:  # Common Teensy VID/PIDs
+            elif port.vid == _TEENSY_VID and port.pid in _TEENSY_PIDS:
                 is_teensy = True
                 teensy_ports.append(port)
             else:
                 other_ports.append(port)
             
-            self.port_combo.addItem(port.device)
-            if hasattr(self, 'imu_port_combo'):
-                self.imu_port_combo.addItem(port.device)
-            if hasattr(self, 'final_port_combo'):
-                self.final_port_combo.addItem(port.device)
-            
             if is_teensy:
                 port_log = f"  {port_info} [TEENSY DETECTED]"
                 ui_message = self.logger.log_success(port_log)
@@ -723,8 +905,12 @@ class LoadCellCalibrationGUI(QMainWindow):
             
             # Connect signals
             self.serial_worker.data_received.connect(self.handle_serial_data)
+            self.serial_worker.calibration_factor_received.connect(self.handle_calibration_factor)
             self.serial_worker.connection_lost.connect(self.handle_connection_lost)
             self.serial_thread.started.connect(self.serial_worker.start_connection)
+            # Direct: the worker thread quits itself once the port is closed, even while
+            # the GUI thread is blocked in wait()
+            self.serial_worker.stopped.connect(self.serial_thread.quit, Qt.DirectConnection)
             
             # Start thread
             self.serial_thread.start()
@@ -732,7 +918,7 @@ class LoadCellCalibrationGUI(QMainWindow):
             # Update UI
             self.is_connected = True
             self.connect_button.setText("Disconnect from Serial")
-            self.connect_button.setStyleSheet("QPushButton { background: #f44336; color: white; }")
+            self.connect_button.setStyleSheet(_DISCONNECT_BUTTON_SS)
             self.tare_button.setEnabled(True)
             self.calibrate_button.setEnabled(True)
             self.send_mass_button.setEnabled(True)
@@ -749,15 +935,18 @@ class LoadCellCalibrationGUI(QMainWindow):
             self.logger.log_error(error_msg)
             QMessageBox.critical(self, "Error", error_msg)
             
-    def disconnect_serial(self):
-        """Disconnect from serial port"""
+    def disconnect_serial(self, silent=False):
+        """Disconnect from serial port (silent skips the UI message, e.g. before an upload)"""
         self.logger.log_serial("Disconnecting from serial port", "DISCONNECT")
         
         if self.serial_worker:
             self.serial_worker.stop_connection()
         if self.serial_thread:
-            self.serial_thread.quit()
-            self.serial_thread.wait()
+            # stop_connection() quits the thread after closing the port; the read loop
+            # yields every 50 ms, so this only times out if the port is wedged
+            if not self.serial_thread.wait(_THREAD_STOP_TIMEOUT_MS):
+                self.logger.log_warning("Serial thread did not stop in time")
+                self._keep_until_finished(self.serial_thread, self.serial_worker)
             
         self.is_connected = False
         self.connect_button.setText("Connect to Serial")
@@ -766,84 +955,101 @@ class LoadCellCalibrationGUI(QMainWindow):
         self.calibrate_button.setEnabled(False)
         self.send_mass_button.setEnabled(False)
         
-        ui_message = self.logger.log("Disconnected from serial")
-        self.log_message_to_ui(ui_message)
+        if not silent:
+            ui_message = self.logger.log("Disconnected from serial")
+            self.log_message_to_ui(ui_message)
+        
+    def _keep_until_finished(self, thread, worker):
+        """Hold a still-running worker thread until it finishes, so a reconnect can replace it"""
+        self._stopping_threads.append((thread, worker))
+        # Bound to self, so the cleanup is queued to the GUI thread after the thread ends
+        thread.finished.connect(self._drop_finished_threads)
+        
+    def _drop_finished_threads(self):
+        """Release stopping worker threads that have finished"""
+        self._stopping_threads = [entry for entry in self._stopping_threads if not entry[0].isFinished()]
         
     def handle_serial_data(self, data):
         """Handle incoming serial data"""
         ui_message = self.logger.log_serial(data, "RX")
         self.log_message_to_ui(f"Arduino: {data}")
         
-        # Check for calibration factor in the data
-        if "calibration value has been set to:" in data.lower():
-            try:
-                # Extract calibration factor
-                parts = data.split(":")
-                if len(parts) > 1:
-                    cal_factor = float(parts[1].split(",")[0].strip())
-                    self.current_calibration_factor = cal_factor
-                    self.has_loadcell_calibration = True  # Mark load cell calibration as complete
-                    self.cal_factor_label.setText(f"Calibration Factor: {cal_factor:.2f}")
-                    self.cal_factor_label.setStyleSheet("QLabel { background: #d4edda; padding: 10px; border: 1px solid #c3e6cb; color: #155724; }")
-                    
-                    # Log calibration success
-                    cal_msg = f"Calibration factor received: {cal_factor:.2f}"
-                    self.logger.log_calibration(cal_msg)
-                    
-                    step_msg = f"✓ Step 2 completed! Calibration factor: {cal_factor:.2f}"
-                    ui_message = self.logger.log_step(step_msg)
-                    self.log_message_to_ui(ui_message)
-                    
-                    # Update status and proceed to completed state
-                    self.current_step = 3
-                    self.update_step_status()
-                    
-                    # Update calibration status display
-                    self.calibration_status_label.setText(f"✓ Load cell calibration saved successfully!\nCalibration Factor: {cal_factor:.2f}\n\nGo to 'Upload Firmware' tab to upload final firmware.")
-                    self.calibration_status_label.setStyleSheet("""
-                    QLabel { 
-                        background: #e8f5e8; 
-                        color: #2e7d32; 
-                        padding: 15px; 
-                        border: 2px solid #4caf50; 
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 11pt;
-                    }
-                    """)
-                    
-                    QMessageBox.information(self, "Calibration Saved", 
-                        f"Calibration saved successfully!\nCalibration Factor: {cal_factor:.2f}\n\nYou can now go to the 'Upload Firmware' tab.")
-            except:
-                pass
-                
+    def handle_calibration_factor(self, cal_factor):
+        """Handle a calibration factor reported by the load cell firmware"""
+        self.current_calibration_factor = cal_factor
+        self.has_loadcell_calibration = True  # Mark load cell calibration as complete
+        self.cal_factor_label.setText(f"Calibration Factor: {cal_factor:.2f}")
+        self.cal_factor_label.setStyleSheet("QLabel { background: #d4edda; padding: 10px; border: 1px solid #c3e6cb; color: #155724; }")
+        
+        # Log calibration success
+        cal_msg = f"Calibration factor received: {cal_factor:.2f}"
+        self.logger.log_calibration(cal_msg)
+        
+        step_msg = f"✓ Step 2 completed! Calibration factor: {cal_factor:.2f}"
+        ui_message = self.logger.log_step(step_msg)
+        self.log_message_to_ui(ui_message)
+        
+        # Update status and proceed to completed state
+        self.current_step = 3
+        self.update_step_status()
+        
+        # Update calibration status display
+        self.calibration_status_label.setText(f"✓ Load cell calibration saved successfully!\nCalibration Factor: {cal_factor:.2f}\n\nGo to 'Upload Firmware' tab to upload final firmware.")
+        self.calibration_status_label.setStyleSheet("""
+        QLabel { 
+            background: #e8f5e8; 
+            color: #2e7d32; 
+            padding: 15px; 
+            border: 2px solid #4caf50; 
+            border-radius: 8px;
+            font-weight: bold;
+            font-size: 11pt;
+        }
+        """)
+        
+        QMessageBox.information(self, "Calibration Saved", 
+            f"Calibration saved successfully!\nCalibration Factor: {cal_factor:.2f}\n\nYou can now go to the 'Upload Firmware' tab.")
+            
     def handle_connection_lost(self):
         """Handle lost connection"""
-        self.logger.log_error("Serial connection lost")
+        ui_message = self.logger.log_error("Serial connection lost")
         self.disconnect_serial()
-        QMessageBox.warning(self, "Warning", "Connection lost!")
+        # Non-modal notice; the monitor keeps the error line
+        self.log_message_to_ui(ui_message)
+        self.statusBar().showMessage("Serial connection lost", 5000)
         
     def send_tare(self):
         """Send tare command"""
-        if self.serial_worker:
-            self.serial_worker.send_data("t")
-            ui_message = self.logger.log_serial("t", "TX")
-            self.log_message_to_ui("Sent: t (tare)")
-            
+        self._send_cmd('tare')
+        
     def start_calibration(self):
         """Start calibration process"""
-        if self.serial_worker:
-            self.serial_worker.send_data("r")
-            ui_message = self.logger.log_serial("r", "TX")
-            self.log_message_to_ui("Sent: r (start calibration)")
-            
+        self._send_cmd('calib')
+        
     def send_known_mass(self):
         """Send known mass value"""
-        if self.serial_worker:
-            mass = self.known_mass_spin.value()
-            self.serial_worker.send_data(f"{mass}\n")
-            ui_message = self.logger.log_serial(f"{mass}", "TX")
-            self.log_message_to_ui(f"Sent: {mass} (known mass)")
+        self._send_cmd('mass')
+        
+    def _send_cmd(self, key):
+        """Send a load cell command ('tare', 'calib' or 'mass') to the Arduino"""
+        if not (self.is_connected and self.serial_worker):
+            return
+            
+        if key == 'mass':
+            mass_text = f"{self.known_mass_spin.value():.1f}"
+            payload = f"{mass_text}\n".encode('ascii')
+            ui_text = f"Sent: {mass_text} (known mass)"
+            log_text = mass_text
+        else:
+            payload = self._cmd_bytes[key]
+            log_text = payload.decode('ascii')
+            ui_text = f"Sent: {log_text} ({self._cmd_labels[key]})"
+            
+        if not self.serial_worker.send_data(payload):
+            return
+            
+        self.logger.log_serial(log_text, "TX")
+        self.log_message_to_ui(ui_text)
 
     def auto_switch_to_loadcell_mode(self):
         """Auto-switch to Load Cell mode when connecting from Load Cell tab"""
@@ -858,23 +1064,40 @@ class LoadCellCalibrationGUI(QMainWindow):
             self.log_imu_message_to_ui(">>> Switched to IMU mode")
 
     def log_message_to_ui(self, message):
-        """Add message to serial output (UI only)"""
-        self.serial_output.append(message)
-        
-        # Auto-scroll to bottom
-        cursor = self.serial_output.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.serial_output.setTextCursor(cursor)
-        
+        """Queue message for the serial output (UI only)"""
+        self._queue_ui_line(self._ui_log_buf, 'serial', message)
+        
+    def _queue_ui_line(self, buf, key, message):
+        """Queue one message for an output, counting lines a full buffer drops"""
+        if len(buf) == buf.maxlen:
+            self._ui_log_omitted[key] += 1
+        buf.append(message)
+        if not self._ui_log_timer.isActive():
+            self._ui_log_timer.start()
+            
+    def _flush_ui_log(self):
+        """Append all queued messages to the visible serial/IMU/upload outputs, one block each"""
+        for output, buf, key in ((self.serial_output, self._ui_log_buf, 'serial'),
+                                 (self.imu_serial_output, self._imu_ui_log_buf, 'imu'),
+                                 (self.upload_status_text, self._upload_ui_log_buf, 'upload')):
+            # A hidden output is not laid out; its buffer holds the lines until it is shown
+            if buf and output.isVisible():
+                text = "\n".join(buf)
+                omitted = self._ui_log_omitted[key]
+                if omitted:
+                    text = f"... {omitted} lines omitted\n{text}"
+                    self._ui_log_omitted[key] = 0
+                # QPlainTextEdit keeps following the end only if it was already scrolled there
+                output.appendPlainText(text)
+                buf.clear()
+                
     def clear_serial_output(self):
         """Clear serial output"""
         self.logger.log("Serial output cleared by user")
+        self._ui_log_buf.clear()
+        self._ui_log_omitted['serial'] = 0
         self.serial_output.clear()
         
-    def update_display(self):
-        """Update display periodically"""
-        pass
-    
     # Update Management Methods
     def check_for_updates(self):
         """Check for application updates in background."""
@@ -932,12 +1155,13 @@ class LoadCellCalibrationGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a port first!")
             return
             
+        port_settle = 0
         # Disconnect IMU serial if connected
         if self.is_imu_connected:
             ui_message = self.logger.log("Disconnecting IMU for upload")
             self.log_imu_message_to_ui(ui_message)
-            self.disconnect_imu_serial()
-            time.sleep(1)
+            self.disconnect_imu_serial(silent=True)
+            port_settle = _PORT_SETTLE_SECS
             
         # Show progress bar
         self.progress_bar.setVisible(True)
@@ -963,7 +1187,7 @@ class LoadCellCalibrationGUI(QMainWindow):
                 selected_board = "arduino:mbed_nano:nano33ble"
         
         # Run upload in separate thread
-        threading.Thread(target=self._upload_thread, args=(self.unified_calibration_file, selected_board, selected_port, "unified_calibration_imu"), daemon=True).start()
+        threading.Thread(target=self._upload_thread, args=(self.unified_calibration_file, selected_board, selected_port, "unified_calibration_imu", port_settle), daemon=True).start()
     
     def detect_board_on_port(self, port):
         """Auto-detect board type on specified port"""
@@ -972,7 +1196,7 @@ class LoadCellCalibrationGUI(QMainWindow):
             arduino_cli_path = self.arduino_manager.get_arduino_cli_command()
 
             # Run board list command and parse output
-            result = subprocess.run(f'"{arduino_cli_path}" board list', shell=True, capture_output=True, text=True, timeout=10)
+            result = run_cli([arduino_cli_path, "board", "list"], timeout=10)
             
             if result.returncode == 0:
                 lines = result.stdout.strip().split('\n')
@@ -1017,9 +1241,15 @@ class LoadCellCalibrationGUI(QMainWindow):
             self.imu_worker.moveToThread(self.imu_thread)
             
             # Connect signals
-            self.imu_worker.data_received.connect(self.handle_imu_data)
+            self.imu_worker.samples_ready.connect(self.handle_imu_samples)
+            self.imu_worker.offsets_received.connect(self.handle_calculated_offsets)
+            self.imu_worker.raw_message.connect(self.handle_imu_message)
+            self.imu_worker.error_occurred.connect(self.handle_imu_error)
             self.imu_worker.connection_lost.connect(self.handle_imu_connection_lost)
             self.imu_thread.started.connect(self.imu_worker.start_connection)
+            # Direct: the worker thread quits itself once the port is closed, even while
+            # the GUI thread is blocked in wait()
+            self.imu_worker.stopped.connect(self.imu_thread.quit, Qt.DirectConnection)
             
             # Start thread
             self.imu_thread.start()
@@ -1027,7 +1257,7 @@ class LoadCellCalibrationGUI(QMainWindow):
             # Update UI
             self.is_imu_connected = True
             self.imu_connect_button.setText("Disconnect IMU")
-            self.imu_connect_button.setStyleSheet("QPushButton { background: #f44336; color: white; }")
+            self.imu_connect_button.setStyleSheet(_DISCONNECT_BUTTON_SS)
             self.start_imu_cal_button.setEnabled(True)
 
             success_msg = f"Connected to IMU at {selected_port}"
@@ -1042,15 +1272,18 @@ class LoadCellCalibrationGUI(QMainWindow):
             self.logger.log_error(error_msg)
             QMessageBox.critical(self, "Error", error_msg)
             
-    def disconnect_imu_serial(self):
-        """Disconnect from IMU port"""
+    def disconnect_imu_serial(self, silent=False):
+        """Disconnect from IMU port (silent skips the UI message, e.g. before an upload)"""
         self.logger.log_imu("Disconnecting from IMU port")
         
         if self.imu_worker:
             self.imu_worker.stop_connection()
         if self.imu_thread:
-            self.imu_thread.quit()
-            self.imu_thread.wait()
+            # stop_connection() quits the thread after closing the port; the read loop
+            # yields every 50 ms, so this only times out if the port is wedged
+            if not self.imu_thread.wait(_THREAD_STOP_TIMEOUT_MS):
+                self.logger.log_warning("IMU thread did not stop in time")
+                self._keep_until_finished(self.imu_thread, self.imu_worker)
             
         self.is_imu_connected = False
         self.imu_calibration_started = False  # Reset calibration state
@@ -1058,63 +1291,80 @@ class LoadCellCalibrationGUI(QMainWindow):
         self.imu_connect_button.setStyleSheet("")
         self.start_imu_cal_button.setEnabled(False)
         
-        ui_message = self.logger.log("Disconnected from IMU")
-        self.log_imu_message_to_ui(ui_message)
+        if not silent:
+            ui_message = self.logger.log("Disconnected from IMU")
+            self.log_imu_message_to_ui(ui_message)
         
+    def handle_imu_samples(self, head):
+        """Handle new IMU samples; only the newest one is displayed"""
+        if self.imu_worker:
+            self.handle_imu_data(self.imu_worker.sample(head - 1))
+            
     def handle_imu_data(self, data):
-        """Handle incoming IMU data"""
-        if "error" in data:
-            ui_message = self.logger.log_error(data["error"])
-            self.log_imu_message_to_ui(ui_message)
-        elif "raw_message" in data:
-            ui_message = self.logger.log_imu(data["raw_message"])
-            self.log_imu_message_to_ui(f"Arduino: {data['raw_message']}")
-        elif "calibrated_pitch_offset" in data or "calibrated_roll_offset" in data or \
-             "calibrated_imu2_roll_offset" in data or "calibrated_imu3_roll_offset" in data:
-            # Handle calculated offset values from Arduino
-            self.handle_calculated_offsets(data)
-        else:
-            # Update current IMU data
-            self.current_imu_data = data
+        """Handle incoming IMU sample"""
+        # Update current IMU data
+        self.current_imu_data = data
+
+        # Widgets are updated from the newest sample by _flush_imu_ui; older ones are dropped
+        self._pending_imu = data
+        if not self._imu_ui_timer.isActive():
+            self._imu_ui_timer.start()
+            
+    def _flush_imu_ui(self):
+        """Show the newest pending IMU sample"""
+        if self._pending_imu is None:
+            return
+        data = self._pending_imu
+        self._pending_imu = None
 
-            # Update visualizations
-            self.update_imu_visualizations(data)
+        # Update visualizations
+        self.update_imu_visualizations(data)
 
-            # Update offsets display
-            self.update_offsets_display(data)
+        # Update offsets display
+        self.update_offsets_display(data)
+        
+    def handle_imu_message(self, message):
+        """Handle a text message from the IMU Arduino"""
+        self.logger.log_imu(message)
+        self.log_imu_message_to_ui(f"Arduino: {message}")
+        
+    def handle_imu_error(self, error):
+        """Handle an IMU connection or send error"""
+        ui_message = self.logger.log_error(error)
+        self.log_imu_message_to_ui(ui_message)
             
     def update_imu_visualizations(self, data):
         """Update IMU visualization widgets"""
-        try:
-            # Update angle indicators
-            self.roll_indicator.set_angle(data['roll'])
-            self.pitch_indicator.set_angle(data['pitch'])
-            self.yaw_indicator.set_angle(data['yaw'])
-            
-            # Update attitude indicator
-            self.attitude_indicator.set_attitude(data['pitch'], data['roll'])
-            
-            # Update LCD displays
-            self.ax_lcd.display(f"{data['ax']:.3f}")
-            self.ay_lcd.display(f"{data['ay']:.3f}")
-            self.az_lcd.display(f"{data['az']:.3f}")
-            
-        except KeyError as e:
-            self.logger.log_error(f"Missing IMU data field: {e}")
+        # Update angle indicators
+        self.roll_indicator.set_angle(data.roll)
+        self.pitch_indicator.set_angle(data.pitch)
+        self.yaw_indicator.set_angle(data.yaw)
+        
+        # Update attitude indicator
+        self.attitude_indicator.set_attitude(data.pitch, data.roll)
+        
+        # Update LCD displays
+        self._set_lcd(self.ax_lcd, '_last_ax', data.ax)
+        self._set_lcd(self.ay_lcd, '_last_ay', data.ay)
+        self._set_lcd(self.az_lcd, '_last_az', data.az)
+        
+    def _set_lcd(self, lcd, last_attr, value):
+        """Update an LCD only when its displayed (3 decimal) value changes"""
+        q = round(value, 3)
+        if getattr(self, last_attr) != q:
+            # Formatted so the readout keeps a fixed three decimals (display(float) uses %g)
+            lcd.display(f"{q:.3f}")
+            setattr(self, last_attr, q)
             
     def update_offsets_display(self, data):
-        """Update offset display labels and store current offsets (4-offset formula-based - X/Y/Z offsets not displayed)"""
-        try:
-            # Store offset data for reference (not displayed in UI for 4-offset system)
-            self.current_offset_x = data.get('offset_x', 0.0)
-            self.current_offset_y = data.get('offset_y', 0.0)
-            self.current_offset_z = data.get('offset_z', 0.0)
+        """Store current offsets (4-offset formula-based - X/Y/Z offsets not displayed)"""
+        # Store offset data for reference (not displayed in UI for 4-offset system)
+        self.current_offset_x = data.offset_x
+        self.current_offset_y = data.offset_y
+        self.current_offset_z = data.offset_z
 
-            # Note: X/Y/Z offset labels removed from UI for 4-offset formula-based system
-            # The new system directly calculates pitch/roll offsets from accelerometer data
-
-        except KeyError:
-            pass
+        # Note: X/Y/Z offset labels removed from UI for 4-offset formula-based system
+        # The new system directly calculates pitch/roll offsets from accelerometer data
             
     def handle_calculated_offsets(self, data):
         """Handle calculated offset values from Arduino calibration"""
@@ -1166,9 +1416,11 @@ class LoadCellCalibrationGUI(QMainWindow):
 
     def handle_imu_connection_lost(self):
         """Handle lost IMU connection"""
-        self.logger.log_error("IMU connection lost")
+        ui_message = self.logger.log_error("IMU connection lost")
         self.disconnect_imu_serial()
-        QMessageBox.warning(self, "Warning", "IMU connection lost!")
+        # Non-modal notice; the monitor keeps the error line
+        self.log_imu_message_to_ui(ui_message)
+        self.statusBar().showMessage("IMU connection lost", 5000)
         
     def start_imu_calibration(self):
         """Start IMU calibration process and auto-save when complete"""
@@ -1344,17 +1596,14 @@ class LoadCellCalibrationGUI(QMainWindow):
             QMessageBox.critical(self, "Error", error_msg)
             
     def log_imu_message_to_ui(self, message):
-        """Add message to IMU serial output (UI only)"""
-        self.imu_serial_output.append(message)
-        
-        # Auto-scroll to bottom
-        cursor = self.imu_serial_output.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.imu_serial_output.setTextCursor(cursor)
+        """Queue message for the IMU serial output (UI only)"""
+        self._queue_ui_line(self._imu_ui_log_buf, 'imu', message)
         
     def clear_imu_output(self):
         """Clear IMU serial output"""
         self.logger.log("IMU output cleared by user")
+        self._imu_ui_log_buf.clear()
+        self._ui_log_omitted['imu'] = 0
         self.imu_serial_output.clear()
         
     # 3-IMU System Methods
@@ -1386,13 +1635,13 @@ class LoadCellCalibrationGUI(QMainWindow):
             
     def save_current_imu_offsets(self):
         """Save current IMU calibration as angle offsets (4-offset formula-based)"""
-        if not self.current_imu_data:
+        if self.current_imu_data is None:
             QMessageBox.warning(self, "Warning", "No IMU data available. Please connect and calibrate first.")
             return
 
         # Get current pitch and roll from live data
-        current_pitch = self.current_imu_data.get('pitch', 0.0)
-        current_roll = self.current_imu_data.get('roll', 0.0)
+        current_pitch = self.current_imu_data.pitch
+        current_roll = self.current_imu_data.roll
 
         imu_names = ["IMU 1", "IMU 2", "IMU 3"]
         current_imu_name = imu_names[self.current_imu_index]
@@ -1837,15 +2086,8 @@ class LoadCellCalibrationGUI(QMainWindow):
             QMessageBox.critical(self, "Error", error_msg)
 
     def log_upload_message_to_ui(self, message):
-        """Add message to upload firmware status output"""
-        if hasattr(self, 'upload_status_text'):
-            self.upload_status_text.append(message)
-
-            # Auto-scroll to bottom
-            from PySide6.QtGui import QTextCursor
-            cursor = self.upload_status_text.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.upload_status_text.setTextCursor(cursor)
+        """Queue message for the upload firmware status output"""
+        self._queue_ui_line(self._upload_ui_log_buf, 'upload', message)
             
     def closeEvent(self, event):
         """Handle application close"""
@@ -1855,12 +2097,22 @@ class LoadCellCalibrationGUI(QMainWindow):
         if self.is_imu_connected:
             self.disconnect_imu_serial()
         
+        # Threads still running when Python tears down would make Qt abort the process
+        threads = [thread for thread, _ in self._stopping_threads]
+        if self._scan_in_progress:
+            threads.append(self.port_scan_thread)
+        still_running = [thread for thread in threads if not thread.wait(_THREAD_STOP_TIMEOUT_MS)]
+        if still_running:
+            self.logger.log_warning(f"{len(still_running)} worker thread(s) still running at exit")
+        
         # Clean up temp files
         self.user_data.cleanup_temp_files()
         
         # Write session end
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        footer = f"\n{'='*60}\nSESSION END: {timestamp}\n{'='*60}\n"
-        self.logger.write_to_file(footer)
+        self.logger.write_session_footer()
+        self.logger.close()
         
-        event.accept()
\ No newline at end of file
+        event.accept()
+        if still_running:
+            # The log is flushed; exit without destroying the running QThreads
+            os._exit(0)
\ No newline at end of file
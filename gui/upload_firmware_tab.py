@@ -4,7 +4,7 @@ Upload Firmware tab UI components for final calibration data management.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
                                QLabel, QPushButton, QTableWidget, QTableWidgetItem,
-                               QTextEdit, QComboBox, QGridLayout, QHeaderView)
+                               QPlainTextEdit, QComboBox, QGridLayout, QHeaderView)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
@@ -214,7 +214,7 @@ def setup_upload_firmware_tab(main_window):
     firmware_layout.addLayout(upload_buttons_layout)
     
     # Status display
-    main_window.upload_status_text = QTextEdit()
+    main_window.upload_status_text = QPlainTextEdit()
     main_window.upload_status_text.setReadOnly(True)
     main_window.upload_status_text.setFont(QFont("Courier", 9))
     main_window.upload_status_text.setMaximumHeight(150)
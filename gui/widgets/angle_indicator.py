@@ -3,8 +3,8 @@ Angle indicator widget for displaying IMU angle values with visual arc.
 """
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
 
 
 class AngleIndicator(QWidget):
@@ -19,9 +19,32 @@ class AngleIndicator(QWidget):
         self.color = color
         self.setMinimumSize(150, 150)
         
+        # Painting resources, created once instead of on every repaint
+        self._bg_pen = QPen(QColor(200, 200, 200), 2)
+        self._arc_pen = QPen(self.color, 4)
+        self._dot_brush = QBrush(self.color)
+        self._text_pen = QPen(QColor(50, 50, 50), 2)
+        self._value_font = QFont("Arial", 12, QFont.Bold)
+        self._title_font = QFont("Arial", 10, QFont.Bold)
+        self._value_height = QFontMetrics(self._value_font).height()
+        
     def set_angle(self, angle):
-        self.angle = max(self.min_angle, min(self.max_angle, angle))
-        self.update()
+        angle = max(self.min_angle, min(self.max_angle, angle))
+        # The readout shows 0.1° steps and the arc moves less than that; skip invisible changes
+        if round(angle, 1) == round(self.angle, 1):
+            return
+        self.angle = angle
+        # Only the dial and the value text change; the title stays put
+        self.update(self._dirty_rect())
+        
+    def _dirty_rect(self):
+        """Area covered by the dial and the value text"""
+        rect = self.rect()
+        center = rect.center()
+        radius = min(rect.width(), rect.height()) // 2 - 20
+        dial = QRect(center.x() - radius, center.y() - radius, radius * 2, radius * 2).adjusted(-3, -3, 3, 3)
+        value = QRect(0, rect.height() - self._value_height, rect.width(), self._value_height)
+        return dial.united(value)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -32,25 +55,25 @@ class AngleIndicator(QWidget):
         radius = min(rect.width(), rect.height()) // 2 - 20
         
         # Draw background circle
-        painter.setPen(QPen(QColor(200, 200, 200), 2))
+        painter.setPen(self._bg_pen)
         painter.drawEllipse(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
         
         # Draw angle arc
-        painter.setPen(QPen(self.color, 4))
+        painter.setPen(self._arc_pen)
         start_angle = 90 * 16  # Start from top (90 degrees in 1/16th degree units)
         span_angle = -int((self.angle / 180.0) * 180 * 16)  # Convert to 1/16th degrees
         painter.drawArc(center.x() - radius, center.y() - radius, radius * 2, radius * 2, start_angle, span_angle)
         
         # Draw center dot
-        painter.setBrush(QBrush(self.color))
+        painter.setBrush(self._dot_brush)
         painter.drawEllipse(center.x() - 3, center.y() - 3, 6, 6)
         
         # Draw angle text
-        painter.setPen(QPen(QColor(50, 50, 50), 2))
-        painter.setFont(QFont("Arial", 12, QFont.Bold))
+        painter.setPen(self._text_pen)
+        painter.setFont(self._value_font)
         angle_text = f"{self.angle:.1f}°"
         painter.drawText(rect, Qt.AlignCenter | Qt.AlignBottom, angle_text)
         
         # Draw title
-        painter.setFont(QFont("Arial", 10, QFont.Bold))
+        painter.setFont(self._title_font)
         painter.drawText(rect, Qt.AlignCenter | Qt.AlignTop, self.title)
\ No newline at end of file
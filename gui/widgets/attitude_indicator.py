@@ -3,8 +3,8 @@
 """
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QLinearGradient
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QLinearGradient, QTransform
 
 
 class AttitudeIndicator(QWidget):
@@ -14,12 +14,50 @@ class AttitudeIndicator(QWidget):
         super().__init__()
         self.pitch = 0.0
         self.roll = 0.0
+        # Horizon rotation/offset, rebuilt only when the attitude changes
+        self._attitude_transform = QTransform()
         self.setMinimumSize(200, 200)
         
+        # Painting resources, created once instead of on every repaint
+        self._aircraft_pen = QPen(QColor(255, 255, 0), 3)  # Yellow
+        self._ring_pen = QPen(QColor(50, 50, 50), 2)
+        self._text_pen = QPen(QColor(50, 50, 50), 1)
+        self._text_font = QFont("Arial", 10)
+        self._sky_brush = self._make_sky_brush(self.height())
+        
+    def _make_sky_brush(self, height):
+        """Create the sky/ground gradient brush for the given widget height"""
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(135, 206, 235))  # Sky blue
+        gradient.setColorAt(0.5, QColor(255, 255, 255))  # Horizon
+        gradient.setColorAt(1, QColor(139, 69, 19))  # Brown earth
+        return QBrush(gradient)
+        
+    def resizeEvent(self, event):
+        self._sky_brush = self._make_sky_brush(self.height())
+        super().resizeEvent(event)
+        
     def set_attitude(self, pitch, roll):
+        # Changes this small don't move anything visibly; skip the repaint
+        if abs(pitch - self.pitch) < 0.05 and abs(roll - self.roll) < 0.05:
+            return
+        old_rect = self._dirty_rect()
         self.pitch = pitch
         self.roll = roll
-        self.update()
+        self._attitude_transform = QTransform().rotate(roll).translate(0, pitch * 2)  # Scale pitch movement
+        # Repaint where the horizon disc was and where it is now
+        self.update(old_rect.united(self._dirty_rect()))
+        
+    def _dirty_rect(self):
+        """Area covered by the horizon disc, outer ring and readout for the current attitude"""
+        rect = self.rect()
+        center = rect.center()
+        radius = min(rect.width(), rect.height()) // 2 - 10
+        circle = QRect(-radius, -radius, radius * 2, radius * 2)
+        disc = (self._attitude_transform * QTransform.fromTranslate(center.x(), center.y())).mapRect(circle)
+        ring = circle.translated(center)
+        readout = QRect(0, center.y() + radius, rect.width(), rect.height() - center.y() - radius)
+        return disc.united(ring).united(readout).adjusted(-3, -3, 3, 3)
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -29,19 +67,13 @@ class AttitudeIndicator(QWidget):
         center = rect.center()
         radius = min(rect.width(), rect.height()) // 2 - 10
         
-        # Create gradient for sky/ground
-        gradient = QLinearGradient(0, 0, 0, rect.height())
-        gradient.setColorAt(0, QColor(135, 206, 235))  # Sky blue
-        gradient.setColorAt(0.5, QColor(255, 255, 255))  # Horizon
-        gradient.setColorAt(1, QColor(139, 69, 19))  # Brown earth
-        
-        painter.setBrush(QBrush(gradient))
+        # Gradient for sky/ground
+        painter.setBrush(self._sky_brush)
         painter.setPen(Qt.NoPen)
         
         # Rotate and translate for attitude
         painter.translate(center)
-        painter.rotate(self.roll)
-        painter.translate(0, self.pitch * 2)  # Scale pitch movement
+        painter.setTransform(self._attitude_transform, True)
         
         # Draw attitude background
         painter.drawEllipse(-radius, -radius, radius * 2, radius * 2)
@@ -50,18 +82,18 @@ class AttitudeIndicator(QWidget):
         painter.translate(center)
         
         # Draw aircraft symbol (fixed)
-        painter.setPen(QPen(QColor(255, 255, 0), 3))  # Yellow
+        painter.setPen(self._aircraft_pen)
         painter.drawLine(-30, 0, -10, 0)  # Left wing
         painter.drawLine(10, 0, 30, 0)    # Right wing
         painter.drawLine(0, -5, 0, 5)     # Center line
         
         # Draw outer ring
-        painter.setPen(QPen(QColor(50, 50, 50), 2))
+        painter.setPen(self._ring_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(-radius, -radius, radius * 2, radius * 2)
         
         # Draw pitch/roll text
-        painter.setPen(QPen(QColor(50, 50, 50), 1))
-        painter.setFont(QFont("Arial", 10))
+        painter.setPen(self._text_pen)
+        painter.setFont(self._text_font)
         painter.drawText(-radius, radius + 15, f"P: {self.pitch:.1f}°")
         painter.drawText(radius - 50, radius + 15, f"R: {self.roll:.1f}°")
\ No newline at end of file
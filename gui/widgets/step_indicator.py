@@ -10,6 +10,37 @@ from PySide6.QtGui import QFont
 class StepIndicator(QWidget):
     """Custom widget for showing step progress with checkmarks"""
     
+    _SS_DONE = """
+        QLabel {
+            border: 2px solid #4CAF50;
+            border-radius: 20px;
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+            font-size: 16px;
+        }
+    """
+    _SS_CURRENT = """
+        QLabel {
+            border: 2px solid #2196F3;
+            border-radius: 20px;
+            background-color: #2196F3;
+            color: white;
+            font-weight: bold;
+            font-size: 16px;
+        }
+    """
+    _SS_IDLE = """
+        QLabel {
+            border: 2px solid #ccc;
+            border-radius: 20px;
+            background-color: #f0f0f0;
+            color: #666;
+            font-weight: bold;
+            font-size: 16px;
+        }
+    """
+    
     def __init__(self, step_number, title, description):
         super().__init__()
         self.step_number = step_number
@@ -17,6 +48,7 @@ class StepIndicator(QWidget):
         self.description = description
         self.is_completed = False
         self.is_current = False
+        self._applied_state = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -27,17 +59,6 @@ class StepIndicator(QWidget):
         self.step_label = QLabel()
         self.step_label.setFixedSize(40, 40)
         self.step_label.setAlignment(Qt.AlignCenter)
-        self.step_label.setStyleSheet("""
-            QLabel {
-                border: 2px solid #ccc;
-                border-radius: 20px;
-                background-color: #f0f0f0;
-                color: #666;
-                font-weight: bold;
-                font-size: 16px;
-            }
-        """)
-        self.step_label.setText(str(self.step_number))
         
         # Text content
         text_layout = QVBoxLayout()
@@ -67,43 +88,26 @@ class StepIndicator(QWidget):
         self.is_current = current
         self.update_appearance()
         
+    def set_state(self, completed, current):
+        self.is_completed = completed
+        self.is_current = current
+        self.update_appearance()
+        
     def update_appearance(self):
+        state = (self.is_completed, self.is_current)
+        if state == self._applied_state:
+            return  # Re-applying an unchanged stylesheet still forces a restyle
+        self._applied_state = state
+        
         if self.is_completed:
-            self.step_label.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #4CAF50;
-                    border-radius: 20px;
-                    background-color: #4CAF50;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-            """)
+            self.step_label.setStyleSheet(self._SS_DONE)
             self.step_label.setText("✓")
             self.title_label.setStyleSheet("color: #4CAF50;")
         elif self.is_current:
-            self.step_label.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #2196F3;
-                    border-radius: 20px;
-                    background-color: #2196F3;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-            """)
+            self.step_label.setStyleSheet(self._SS_CURRENT)
             self.step_label.setText(str(self.step_number))
             self.title_label.setStyleSheet("color: #2196F3; font-weight: bold;")
         else:
-            self.step_label.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #ccc;
-                    border-radius: 20px;
-                    background-color: #f0f0f0;
-                    color: #666;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-            """)
+            self.step_label.setStyleSheet(self._SS_IDLE)
             self.step_label.setText(str(self.step_number))
-            self.title_label.setStyleSheet("color: #333;")
\ No newline at end of file
+            self.title_label.setStyleSheet("color: #333;")
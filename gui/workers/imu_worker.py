@@ -2,74 +2,85 @@
 IMU data worker thread for parsing and handling IMU sensor data.
 """
 
-import serial
-from PySide6.QtCore import QObject, Signal
+import time
+from array import array
+from collections import namedtuple
 
+from PySide6.QtCore import Signal
 
-class IMUDataWorker(QObject):
+from gui.workers.serial_port_worker import SerialPortWorker
+
+
+# One parsed CSV sample from the IMU firmware
+IMUSample = namedtuple('IMUSample', 'ax ay az roll pitch yaw offset_x offset_y offset_z')
+IMU_FIELDS = len(IMUSample._fields)
+
+# Number of recent samples kept in the worker's ring buffer
+RING_SIZE = 4096
+
+
+class IMUDataWorker(SerialPortWorker):
     """Worker thread for parsing IMU data"""
-    data_received = Signal(dict)
-    connection_lost = Signal()
+    samples_ready = Signal(int)  # ring buffer head (total samples received)
+    offsets_received = Signal(dict)  # calculated offsets from calibration
+    raw_message = Signal(str)  # any other text from the Arduino
+    error_occurred = Signal(str)
     
     def __init__(self, port, baudrate):
-        super().__init__()
-        self.port = port
-        self.baudrate = baudrate
-        self.serial_connection = None
-        self.running = False
+        super().__init__(port, baudrate)
+        # Flat ring buffer of the last RING_SIZE samples (IMU_FIELDS doubles each);
+        # sample n lives at slot n % RING_SIZE and head is the number of samples stored
+        self.ring = array('d', bytes(8 * IMU_FIELDS * RING_SIZE))
+        self.head = 0
+        # Head value last announced to the GUI, and when
+        self._emitted_head = 0
+        self._last_emit = 0.0
         
-    def start_connection(self):
-        """Start IMU serial connection and reading loop"""
-        try:
-            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
-            self.running = True
-            self.read_loop()
-        except Exception as e:
-            self.data_received.emit({"error": f"Connection error: {str(e)}"})
+    def emit_latest_sample(self):
+        """Announce new samples to the GUI at most ~60 times per second"""
+        if self.head != self._emitted_head:
+            now = time.monotonic()
+            if now - self._last_emit >= 0.016:
+                self.samples_ready.emit(self.head)
+                self._emitted_head = self.head
+                self._last_emit = now
+                
+    def sample(self, index):
+        """Return sample number index from the ring buffer (valid for the last RING_SIZE samples)"""
+        base = (index % RING_SIZE) * IMU_FIELDS
+        return IMUSample._make(self.ring[base:base + IMU_FIELDS])
+                
+    def handle_line(self, line):
+        """Parse one complete line (bytes) and emit it"""
+        # Streaming samples are parsed straight from bytes into the ring buffer
+        if self.parse_imu_data(line):
+            return
             
-    def read_loop(self):
-        """Continuously read and parse IMU data"""
-        while self.running and self.serial_connection:
-            try:
-                if self.serial_connection.in_waiting:
-                    line = self.serial_connection.readline().decode('utf-8').strip()
-                    if line:
-                        # Check for calculated offset values first
-                        parsed_offset = self.parse_offset_line(line)
-                        if parsed_offset:
-                            self.data_received.emit(parsed_offset)
-                        else:
-                            # Try parsing CSV data
-                            parsed_data = self.parse_imu_data(line)
-                            if parsed_data:
-                                self.data_received.emit(parsed_data)
-                            else:
-                                # Send raw message for display
-                                self.data_received.emit({"raw_message": line})
-            except Exception as e:
-                self.connection_lost.emit()
-                break
+        line = line.decode('utf-8', errors='replace').lstrip()
+        # Check for calculated offset values
+        parsed_offset = self.parse_offset_line(line)
+        if parsed_offset:
+            self.offsets_received.emit(parsed_offset)
+        else:
+            # Send raw message for display
+            self.raw_message.emit(line)
                 
     def parse_imu_data(self, data_line):
-        """Parse IMU data line: AX,AY,AZ,ROLL,PITCH,YAW,OFFSET_X,OFFSET_Y,OFFSET_Z"""
+        """Store IMU data line (bytes) AX,AY,AZ,ROLL,PITCH,YAW,OFFSET_X,OFFSET_Y,OFFSET_Z in the ring buffer.
+        Returns True if the line was a sample."""
+        if data_line[0] == 61:  # ord('='), firmware banner lines
+            return False
+        # Stop splitting after the nine sample fields; extra trailing fields are ignored
         try:
-            if ',' in data_line and not data_line.startswith('='):
-                parts = data_line.split(',')
-                if len(parts) >= 9:
-                    return {
-                        'ax': float(parts[0]),
-                        'ay': float(parts[1]),
-                        'az': float(parts[2]),
-                        'roll': float(parts[3]),
-                        'pitch': float(parts[4]),
-                        'yaw': float(parts[5]),
-                        'offset_x': float(parts[6]),
-                        'offset_y': float(parts[7]),
-                        'offset_z': float(parts[8])
-                    }
-        except (ValueError, IndexError):
-            pass
-        return None
+            values = array('d', map(float, data_line.split(b',', IMU_FIELDS)[:IMU_FIELDS]))
+        except ValueError:
+            return False
+        if len(values) != IMU_FIELDS:
+            return False
+        base = (self.head % RING_SIZE) * IMU_FIELDS
+        self.ring[base:base + IMU_FIELDS] = values
+        self.head += 1
+        return True
 
     def parse_offset_line(self, line):
         """Parse calculated offset lines from Arduino calibration output"""
@@ -98,19 +109,10 @@ class IMUDataWorker(QObject):
             pass
         return None
             
-    def send_data(self, data):
-        """Send data to serial port"""
-        if self.serial_connection and self.serial_connection.is_open:
-            try:
-                self.serial_connection.write(data.encode('utf-8'))
-                return True
-            except Exception as e:
-                self.data_received.emit({"error": f"Send error: {str(e)}"})
-                return False
-        return False
-        
-    def stop_connection(self):
-        """Stop IMU serial connection"""
-        self.running = False
-        if self.serial_connection:
-            self.serial_connection.close()
\ No newline at end of file
+    def batch_done(self):
+        """Announce any samples parsed in this batch"""
+        self.emit_latest_sample()
+            
+    def report_error(self, message):
+        """Report connection and send errors"""
+        self.error_occurred.emit(message)
@@ -0,0 +1,19 @@
+"""
+Port scan worker for enumerating serial ports off the UI thread.
+"""
+
+import serial.tools.list_ports
+from PySide6.QtCore import QObject, Signal
+
+
+class PortScanWorker(QObject):
+    """Worker thread for listing available serial ports"""
+    ports_ready = Signal(list)
+
+    def run(self):
+        """Enumerate serial ports and emit the result"""
+        try:
+            ports = serial.tools.list_ports.comports()
+        except Exception:
+            ports = []
+        self.ports_ready.emit(list(ports))
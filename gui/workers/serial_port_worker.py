@@ -0,0 +1,134 @@
+"""
+Base worker for reading and writing a serial port on its own thread.
+"""
+
+import os
+import select
+import threading
+import serial
+from PySide6.QtCore import QObject, Signal, Slot, QTimer, QMetaObject, Qt
+
+
+class SerialPortWorker(QObject):
+    """Serial port transport shared by the load cell and IMU workers.
+
+    Subclasses implement handle_line() and report_error(), and may override
+    batch_done() to run after each batch of lines."""
+    connection_lost = Signal()
+    stopped = Signal()  # port closed on the worker thread
+
+    def __init__(self, port, baudrate):
+        super().__init__()
+        self.port = port
+        self.baudrate = baudrate
+        self.serial_connection = None
+        self.running = False
+        # Bytes received but not yet terminated by a newline
+        self._buf = bytearray()
+        # Raw file descriptor for select()/os.read() on POSIX, None on Windows
+        self._fd = None
+        # Bytes queued by send_data() for the next write on the worker thread
+        self._tx = bytearray()
+        self._tx_lock = threading.Lock()
+
+    def start_connection(self):
+        """Start serial connection and reading loop"""
+        try:
+            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=0.05)
+            self._fd = self.serial_connection.fileno() if os.name == 'posix' else None
+            self.running = True
+            self.read_batch()
+        except Exception as e:
+            self.report_error(f"Connection error: {str(e)}")
+
+    def read_batch(self):
+        """Read one batch from serial port, then yield to the thread's event loop"""
+        if not (self.running and self.serial_connection):
+            return
+        try:
+            chunk = self._read_chunk()
+            if chunk:
+                self._buf += chunk
+                *lines, self._buf = self._buf.split(b'\n')
+                for line in lines:
+                    # Strip as bytes so blank/CR-only lines are never decoded
+                    line = line.rstrip(b'\r\n\t ')
+                    if line:
+                        self.handle_line(line)
+            self.batch_done()
+        except Exception as e:
+            # A read failing because stop_connection() closed the port is not a lost connection
+            if self.running:
+                self.connection_lost.emit()
+            return
+        # Queued write_pending calls run before the next batch
+        QTimer.singleShot(0, self.read_batch)
+
+    def _read_chunk(self):
+        """Wait up to 50 ms for data and return everything currently available"""
+        if self._fd is not None:
+            # select() and os.read() release the GIL while waiting
+            ready, _, _ = select.select([self._fd], [], [], 0.05)
+            if not ready:
+                return b''
+            try:
+                chunk = os.read(self._fd, 4096)
+            except (BlockingIOError, InterruptedError):
+                # The port is opened non-blocking, so a spurious wakeup is not an error
+                return b''
+            if not chunk:
+                raise serial.SerialException("Device reports readiness to read but returned no data")
+            return chunk
+        # Blocks until at least one byte arrives (or the port timeout),
+        # then takes whatever else is already buffered
+        return self.serial_connection.read(self.serial_connection.in_waiting or 1)
+
+    def handle_line(self, line):
+        """Handle one complete, stripped, non-empty line (bytes)"""
+        raise NotImplementedError
+
+    def batch_done(self):
+        """Called after each read batch has been handled"""
+
+    def report_error(self, message):
+        """Report a connection or send error to the GUI"""
+        raise NotImplementedError
+
+    def send_data(self, data):
+        """Send data to serial port (safe to call from any thread; the write runs on the worker thread)"""
+        if self.serial_connection and self.serial_connection.is_open:
+            payload = data.encode('utf-8') if isinstance(data, str) else data
+            # Sends made before the worker gets to them go out together in one write
+            with self._tx_lock:
+                schedule = not self._tx
+                self._tx += payload
+            if schedule:
+                QMetaObject.invokeMethod(self, "write_pending", Qt.QueuedConnection)
+            return True
+        return False
+
+    @Slot()
+    def write_pending(self):
+        """Write all queued data to serial port"""
+        with self._tx_lock:
+            payload = bytes(self._tx)
+            self._tx.clear()
+        try:
+            self.serial_connection.write(payload)
+        except Exception as e:
+            self.report_error(f"Send error: {str(e)}")
+
+    def stop_connection(self):
+        """Stop serial connection"""
+        # Called from the GUI thread: the port is closed on the worker thread so it is
+        # never closed while a read is still using its file descriptor
+        self.running = False
+        QMetaObject.invokeMethod(self, "close_port", Qt.QueuedConnection)
+
+    @Slot()
+    def close_port(self):
+        """Close the serial port and announce that the worker is done"""
+        if self.serial_connection:
+            self.serial_connection.close()
+        self._fd = None
+        self.stopped.emit()
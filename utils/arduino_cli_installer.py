@@ -207,13 +207,8 @@ class ArduinoCLIInstaller:
             return None
 
         try:
-            import subprocess
-            result = subprocess.run(
-                [str(self.get_executable_path()), "version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            from .arduino_manager import run_cli
+            result = run_cli([str(self.get_executable_path()), "version"], timeout=5)
             if result.returncode == 0:
                 # Parse version from output
                 return result.stdout.strip()
@@ -7,12 +7,66 @@ import sys
 import requests
 import zipfile
 import shutil
+import signal
 import subprocess
+import threading
 import json
 from pathlib import Path
 import platform
 
 
+# Keeps arduino-cli from flashing a console window on Windows (0 on other platforms)
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+def run_cli(args, timeout):
+    """Run a command (argv list) without a console window, capturing text output"""
+    return subprocess.run(args, capture_output=True, text=True, timeout=timeout, creationflags=_NO_WINDOW)
+
+
+def _kill_tree(proc):
+    """Kill a process started by stream_cli() together with its child processes"""
+    try:
+        if os.name == 'posix':
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                           capture_output=True, creationflags=_NO_WINDOW)
+        proc.kill()
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def stream_cli(args, timeout, on_line):
+    """Run a command (argv list) without a console window, passing each non-empty output line
+    (stdout and stderr merged) to on_line as it arrives. Returns the exit code."""
+    # Own session on POSIX so a timeout can kill the tools arduino-cli starts (gcc, avrdude,
+    # teensy_post_compile); they inherit the pipe and would keep the read loop waiting
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                            encoding='utf-8', errors='replace', bufsize=1, creationflags=_NO_WINDOW,
+                            start_new_session=(os.name == 'posix'))
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        _kill_tree(proc)
+
+    killer = threading.Timer(timeout, kill)
+    killer.start()
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    on_line(line)
+        returncode = proc.wait()
+    finally:
+        killer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout)
+    return returncode
+
+
 class ArduinoManager:
     def __init__(self, arduino_cli_dir):
         """
@@ -30,6 +84,9 @@ class ArduinoManager:
         else:
             self.arduino_cli_path = self.arduino_cli_dir / "arduino-cli"
 
+        # Resolved arduino-cli command, cached once the bundled executable is found
+        self._cli_command = None
+
         # Create directories
         self.arduino_cli_dir.mkdir(parents=True, exist_ok=True)
         
@@ -57,8 +114,7 @@ class ArduinoManager:
         
         # Also check if it's in PATH
         try:
-            result = subprocess.run(["arduino-cli", "version"], 
-                                  capture_output=True, text=True, timeout=5)
+            result = run_cli(["arduino-cli", "version"], timeout=5)
             return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
@@ -186,10 +242,12 @@ class ArduinoManager:
     
     def get_arduino_cli_command(self):
         """Get the arduino-cli command to use"""
-        if self.arduino_cli_path.exists():
-            return str(self.arduino_cli_path)
+        if self._cli_command is None and self.arduino_cli_path.exists():
+            self._cli_command = str(self.arduino_cli_path)
+        if self._cli_command is not None:
+            return self._cli_command
         else:
-            return "arduino-cli"  # Assume it's in PATH
+            return "arduino-cli"  # Assume it's in PATH (re-checked until installed)
     
     def initialize_arduino_cli(self, progress_callback=None):
         """Initialize arduino-cli configuration"""
@@ -200,8 +258,7 @@ class ArduinoManager:
                 progress_callback("Initializing Arduino CLI configuration...")
             
             # Initialize config
-            result = subprocess.run([cmd, "config", "init"], 
-                                  capture_output=True, text=True, timeout=30)
+            result = run_cli([cmd, "config", "init"], timeout=30)
             
             if result.returncode != 0:
                 if progress_callback:
@@ -211,8 +268,7 @@ class ArduinoManager:
             if progress_callback:
                 progress_callback("Updating board package index...")
             
-            result = subprocess.run([cmd, "core", "update-index"], 
-                                  capture_output=True, text=True, timeout=60)
+            result = run_cli([cmd, "core", "update-index"], timeout=60)
             
             if result.returncode != 0:
                 if progress_callback:
@@ -226,6 +282,20 @@ class ArduinoManager:
                 progress_callback(f"Arduino CLI initialization failed: {str(e)}")
             return False
     
+    def get_installed_cores(self):
+        """Return the set of installed core IDs (e.g. 'teensy:avr') reported by arduino-cli"""
+        cmd = self.get_arduino_cli_command()
+        result = run_cli([cmd, "core", "list", "--format", "json"], timeout=30)
+        
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "arduino-cli core list failed")
+        
+        data = json.loads(result.stdout or "[]")
+        # Newer arduino-cli versions wrap the list as {"platforms": [...]}
+        if isinstance(data, dict):
+            data = data.get("platforms") or []
+        return {entry["id"] for entry in data if entry.get("id")}
+    
     def install_required_boards(self, progress_callback=None):
         """Install required board packages"""
         cmd = self.get_arduino_cli_command()
@@ -236,8 +306,7 @@ class ArduinoManager:
                     progress_callback(f"Installing board package: {board_package}")
                 
                 # Check if already installed
-                result = subprocess.run([cmd, "core", "list"], 
-                                      capture_output=True, text=True, timeout=30)
+                result = run_cli([cmd, "core", "list"], timeout=30)
                 
                 if board_package in result.stdout:
                     if progress_callback:
@@ -245,8 +314,7 @@ class ArduinoManager:
                     continue
                 
                 # Install the board package
-                result = subprocess.run([cmd, "core", "install", board_package], 
-                                      capture_output=True, text=True, timeout=300)
+                result = run_cli([cmd, "core", "install", board_package], timeout=300)
                 
                 if result.returncode == 0:
                     if progress_callback:
@@ -269,8 +337,7 @@ class ArduinoManager:
                     progress_callback(f"Installing library: {library}")
                 
                 # Check if already installed
-                result = subprocess.run([cmd, "lib", "list"], 
-                                      capture_output=True, text=True, timeout=30)
+                result = run_cli([cmd, "lib", "list"], timeout=30)
                 
                 if library in result.stdout:
                     if progress_callback:
@@ -278,8 +345,7 @@ class ArduinoManager:
                     continue
                 
                 # Install the library
-                result = subprocess.run([cmd, "lib", "install", library], 
-                                      capture_output=True, text=True, timeout=180)
+                result = run_cli([cmd, "lib", "install", library], timeout=180)
                 
                 if result.returncode == 0:
                     if progress_callback:
@@ -328,11 +394,11 @@ class ArduinoManager:
             if progress_callback:
                 progress_callback(f"Compiling {Path(sketch_path).name}...")
             
-            result = subprocess.run([
+            result = run_cli([
                 cmd, "compile", 
                 "--fqbn", board_fqbn,
                 sketch_path
-            ], capture_output=True, text=True, timeout=120)
+            ], timeout=120)
             
             if result.returncode == 0:
                 if progress_callback:
@@ -357,12 +423,12 @@ class ArduinoManager:
             if progress_callback:
                 progress_callback(f"Uploading to {port}...")
             
-            result = subprocess.run([
+            result = run_cli([
                 cmd, "upload",
                 "--fqbn", board_fqbn,
                 "--port", port,
                 sketch_path
-            ], capture_output=True, text=True, timeout=120)
+            ], timeout=120)
             
             if result.returncode == 0:
                 if progress_callback:
@@ -2,7 +2,11 @@
 Centralized logging utility for Load Cell & IMU Calibration application.
 """
 
+import atexit
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 
 
@@ -11,7 +15,22 @@ class Logger:
     
     def __init__(self, log_file_path):
         self.log_file_path = log_file_path
+        # (second, "YYYY-mm-dd", "HH:MM:SS") - strftime only runs when the second changes
+        self._ts_cache = (0, "", "")
         self.ensure_log_directory()
+        
+        # Entries are written by a background thread so logging never blocks on disk I/O,
+        # through a raw O_APPEND descriptor, bypassing Python's buffered file objects
+        try:
+            self._fd = os.open(self.log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError as e:
+            print(f"Error opening log file: {e}")
+            self._fd = None
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+        
         self.write_session_header()
         
     def ensure_log_directory(self):
@@ -26,21 +45,60 @@ class Logger:
         header = f"\n{'='*60}\nLOAD CELL CALIBRATION SESSION START\nTimestamp: {timestamp}\n{'='*60}\n"
         self.write_to_file(header)
         
+    def write_session_footer(self):
+        """Write session end footer to log file"""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        footer = f"\n{'='*60}\nSESSION END: {timestamp}\n{'='*60}\n"
+        self.write_to_file(footer)
+        
     def write_to_file(self, message):
-        """Write message to log file"""
-        try:
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(message)
-                f.flush()  # Ensure immediate write
-        except Exception as e:
-            print(f"Error writing to log file: {e}")
+        """Queue message for writing to the log file"""
+        self._queue.put(message)
+        
+    def _writer_loop(self):
+        """Write queued messages to the log file in batches, at most every 100 ms"""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = batch[:batch.index(None)]
+            if batch and self._fd is not None:
+                try:
+                    os.write(self._fd, "".join(batch).encode('utf-8'))
+                except OSError as e:
+                    print(f"Error writing to log file: {e}")
+            if not stopping:
+                time.sleep(0.1)  # Let the next batch accumulate
+        if self._fd is not None:
+            os.close(self._fd)
             
+    def close(self):
+        """Flush remaining messages and close the log file"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=2)
+            
+    def _clock(self):
+        """Return ('YYYY-mm-dd', 'HH:MM:SS.mmm') using a per-second cache"""
+        now = time.time()
+        sec = int(now)
+        cached_sec, date_str, time_str = self._ts_cache
+        if sec != cached_sec:
+            date_str, time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)).split()
+            self._ts_cache = (sec, date_str, time_str)
+        return date_str, f"{time_str}.{int((now - sec) * 1000):03d}"  # Include milliseconds
+        
     def log(self, message, category="INFO"):
         """Log message with timestamp and category"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Include milliseconds
-        log_entry = f"[{timestamp}] [{category}] {message}\n"
-        self.write_to_file(log_entry)
-        return f"[{timestamp.split()[1]}] {message}"  # Return just time for UI
+        date_str, time_str = self._clock()
+        self.write_to_file(f"[{date_str} {time_str}] [{category}] {message}\n")
+        return f"[{time_str}] {message}"  # Return just time for UI
         
     def log_error(self, message):
         """Log error message"""
@@ -7,6 +7,14 @@ from pathlib import Path
 import sys
 from . import calibration_resources
 
+# Directory containing the bundled sketches, resolved once at import
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller bundle
+    _BASE_DIR = Path(sys._MEIPASS)
+else:
+    # Running as script
+    _BASE_DIR = Path(__file__).resolve().parent.parent
+
 
 class UserDataManager:
     def __init__(self, app_name="MarsLoadCellCalibration"):
@@ -83,14 +91,7 @@ class UserDataManager:
     
     def get_arduino_sketches_dir(self):
         """Get directory for Arduino sketches (relative to executable)"""
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller bundle
-            base_path = Path(sys._MEIPASS)
-        else:
-            # Running as script
-            base_path = Path(__file__).parent.parent
-        
-        return base_path
+        return _BASE_DIR
     
     def copy_arduino_sketches(self):
         """